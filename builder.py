@@ -0,0 +1,210 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from shimoku_api_python import Client
+
+import utils
+from dashboard import COLUMNS, Dashboard
+from scheduler import ScheduledClient
+from timeseries import LAST_YEAR
+
+
+@dataclass
+class BoardSpec:
+    """
+    Description of one board to publish.
+
+    Attributes:
+        workspace (str): Workspace uuid the board is published to.
+        dashboardName (str): Name of the board.
+        rowFilter (dict): Column -> value (or list of values) the rows must match,
+                          e.g. {"Publisher": "Nintendo", "Platform": ["PS3", "X360"]}.
+        locale (str): Locale used to format the KPI numbers (see kpis.LOCALES).
+        salesColumn (str): Sales column the board measures. Regions are sales columns,
+                           not row values, so a per-region board sets e.g. "JP_Sales".
+        firstYear (int, optional): First year of release charted, defaults to the first release.
+        lastYear (int): Last year of release charted (inclusive).
+    """
+
+    workspace: str
+    dashboardName: str
+    rowFilter: Dict[str, Any] = field(default_factory=dict)
+    locale: str = "en"
+    salesColumn: str = "Global_Sales"
+    firstYear: Optional[int] = None
+    lastYear: int = LAST_YEAR
+
+
+class SharedDataset:
+    """
+    Loads the data files once and serves filtered subsets to many boards.
+
+    Row filters are resolved through cached per-column position indexes, so
+    a board only pays for gathering its own rows, of the columns it reads,
+    instead of scanning or copying the whole frame.
+    """
+
+    def __init__(
+        self,
+        fileNames: List[str],
+        key: str = "Video_Games_Sales_as_at_22_Dec_2016",
+    ) -> None:
+        """
+        Initializes the SharedDataset object.
+
+        Parameters:
+        - fileNames (list): Files to load with utils.getData.
+        - key (str): Key of the DataFrame the row filters apply to.
+
+        Returns:
+        - None
+        """
+        self.key = key
+        self.dfs = utils.getData(fileNames)
+        self.positions: Dict[str, Dict[Any, np.ndarray]] = dict()
+
+    def indexColumn(self, column: str) -> Dict[Any, np.ndarray]:
+        """
+        Builds (once) the mapping from each value of a column to its row positions.
+
+        Parameters:
+        - column (str): Column to index.
+
+        Returns:
+        - dict: Value -> sorted array of row positions.
+        """
+        if column not in self.positions:
+            df = self.dfs[self.key]
+            self.positions[column] = df.groupby(column, sort=False, observed=True).indices
+        return self.positions[column]
+
+    def select(self, rowFilter: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Resolves a row filter into row positions.
+
+        Parameters:
+        - rowFilter (dict): Column -> value (or list of values).
+
+        Returns:
+        - np.ndarray or None: Row positions matching every condition, None for no filter.
+
+        Raises:
+        - ValueError: If a column or value of the filter is not in the data, or no row
+          matches every condition, so a typo does not publish an empty board.
+        """
+        selected = None
+        for column, values in rowFilter.items():
+            if column not in self.dfs[self.key].columns:
+                raise ValueError(f"Unknown row filter column: {column}")
+            index = self.indexColumn(column)
+            if not isinstance(values, (list, tuple, set)):
+                values = [values]
+            unknown = [str(value) for value in values if value not in index]
+            if unknown:
+                raise ValueError(f"Unknown {column} in row filter: {', '.join(unknown)}")
+            columnPositions = np.sort(np.concatenate([index[value] for value in values]))
+            selected = (
+                columnPositions
+                if selected is None
+                else np.intersect1d(selected, columnPositions, assume_unique=True)
+            )
+        if selected is not None and not len(selected):
+            raise ValueError(f"Row filter matches no rows: {rowFilter}")
+        return selected
+
+    def view(self, rowFilter: Dict[str, Any], columns: Optional[List[str]] = None) -> dict:
+        """
+        Returns the DataFrames for a board, restricted to the filtered rows.
+
+        Parameters:
+        - rowFilter (dict): Column -> value (or list of values).
+        - columns (list, optional): Columns copied into a filtered frame, all by default.
+
+        Returns:
+        - dict: Same keys as utils.getData; unfiltered frames are shared, not copied.
+        """
+        positions = self.select(rowFilter)
+        if positions is None:
+            return self.dfs
+        df = self.dfs[self.key]
+        if columns is None:
+            columns = list(df.columns)
+        dfs = dict(self.dfs)
+        dfs[self.key] = df.iloc[positions, df.columns.get_indexer(columns)]
+        return dfs
+
+
+class BoardBuilder:
+    """
+    Publishes many boards from one SharedDataset over a worker pool.
+    """
+
+    def __init__(
+        self,
+        clientFactory: Callable[[str], Client],
+        dataset: SharedDataset,
+        maxWorkers: int = 4,
+    ) -> None:
+        """
+        Initializes the BoardBuilder object.
+
+        Parameters:
+        - clientFactory (Callable): Returns a Shimoku client set to the given workspace.
+          Each board gets its own client because the client keeps the current board
+          and menu path as state. ScheduledClient instances (sharing one TokenBucket
+          and with one checkpoint file per board) are flushed after each board.
+        - dataset (SharedDataset): The loaded data shared by every board.
+        - maxWorkers (int): Number of boards published concurrently.
+
+        Returns:
+        - None
+        """
+        self.clientFactory = clientFactory
+        self.dataset = dataset
+        self.maxWorkers = maxWorkers
+
+    def buildBoard(self, spec: BoardSpec) -> str:
+        """
+        Publishes a single board.
+
+        Parameters:
+        - spec (BoardSpec): The board to publish.
+
+        Returns:
+        - str: The name of the published board.
+        """
+        client = self.clientFactory(spec.workspace)
+        dboard = Dashboard(
+            client,
+            dashboardName=spec.dashboardName,
+            dfs=self.dataset.view(spec.rowFilter, COLUMNS + [spec.salesColumn]),
+            locale=spec.locale,
+            salesColumn=spec.salesColumn,
+            firstYear=spec.firstYear,
+            lastYear=spec.lastYear,
+        )
+        dboard.setDashboard()
+        if isinstance(client, ScheduledClient):
+            client.flush()
+            client.clearCheckpoint()
+        return spec.dashboardName
+
+    def build(self, specs: List[BoardSpec]) -> List[str]:
+        """
+        Publishes every board in specs.
+
+        Parameters:
+        - specs (list): BoardSpec objects to publish.
+
+        Returns:
+        - list: Names of the published boards, in the order of specs.
+        """
+        # Check the filters and build the indexes up front, so a bad spec fails
+        # before any board is published and the workers only read shared state
+        for spec in specs:
+            self.dataset.select(spec.rowFilter)
+
+        with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+            return list(executor.map(self.buildBoard, specs))
@@ -1,24 +1,53 @@
-import pandas as pd
+from typing import Optional
+
 from shimoku_api_python import Client
+import kpis
+import timeseries
 import utils  # Assuming utils.py contains the required utility functions
 
+# Columns of the sales data the dashboard reads, besides its sales column
+COLUMNS = ["Platform", "Year_of_Release", "Genre"]
+
 
 class Dashboard:
-    def __init__(self, shimoku: Client) -> None:
+    def __init__(
+        self,
+        shimoku: Client,
+        dashboardName: str = "Video Games Sales",
+        dfs: Optional[dict] = None,
+        locale: str = "en",
+        salesColumn: str = "Global_Sales",
+        firstYear: Optional[int] = None,
+        lastYear: int = timeseries.LAST_YEAR,
+    ) -> None:
         """
         Initializes the Dashboard object.
 
         Parameters:
         - shimoku (Client): An instance of the Shimoku client.
+        - dashboardName (str): Name of the board to publish to.
+        - dfs (dict, optional): Already loaded DataFrames keyed like utils.getData.
+          When given, the data files are not read again.
+        - locale (str): Locale used to format the KPI numbers (see kpis.LOCALES).
+        - salesColumn (str): Sales column every chart and KPI measures, e.g. 'EU_Sales'
+          for a board of the European region.
+        - firstYear (int, optional): First year of release charted, defaults to the first release.
+        - lastYear (int): Last year of release charted (inclusive).
 
         Returns:
         - None
         """
         self.order = 0
         self.shimoku = shimoku
-        self.dashboardName = "Video Games Sales"
+        self.dashboardName = dashboardName
         self.fileNames = ["./data/Video_Games_Sales_as_at_22_Dec_2016.csv"]
-        self.dfs = utils.getData(self.fileNames)
+        self.dfs = utils.getData(self.fileNames) if dfs is None else dfs
+        self.locale = locale
+        self.salesColumn = salesColumn
+        self.firstYear = firstYear
+        self.lastYear = lastYear
+        self.aggregates = dict()
+        self.yearIndex = None
 
     def __str__(self) -> str:
         """
@@ -50,6 +79,35 @@ class Dashboard:
         self.plotSalesYearRelease("Platform")
 
         self.plotTop3()
+        self.plotTrends()
+
+    def getYearIndex(self) -> timeseries.YearIndex:
+        """
+        Returns the year index of the sales data, building it only once.
+
+        Returns:
+        - timeseries.YearIndex: The year index every chart and KPI of the board reads.
+        """
+        if self.yearIndex is None:
+            df = self.dfs["Video_Games_Sales_as_at_22_Dec_2016"]
+            self.yearIndex = timeseries.YearIndex(df, self.firstYear, self.lastYear)
+        return self.yearIndex
+
+    def getAggregate(self, column: str) -> kpis.ColumnAggregate:
+        """
+        Returns the per-group aggregate of a column, computing it only once.
+
+        Parameters:
+        - column (str): The column to aggregate.
+
+        Returns:
+        - kpis.ColumnAggregate: The shared aggregate every KPI of the column is evaluated against.
+        """
+        if column not in self.aggregates:
+            self.aggregates[column] = kpis.ColumnAggregate(
+                self.getYearIndex(), column, self.salesColumn
+            )
+        return self.aggregates[column]
 
     def plotHeader(self, title: str) -> None:
         """
@@ -77,8 +135,9 @@ class Dashboard:
         Returns:
         - None
         """
-        dfVG_Sales = self.dfs["Video_Games_Sales_as_at_22_Dec_2016"]
-        releasesPerYear = utils.groupingByYearCount(dfVG_Sales, "Genre")
+        releasesPerYear = utils.groupingByYearCount(self.getYearIndex(), "Genre")
+        if releasesPerYear.empty:
+            return
         self.shimoku.plt.stacked_bar(
             data=releasesPerYear,
             x="Year_of_Release",
@@ -96,9 +155,8 @@ class Dashboard:
         )
         self.order += 1
 
-        releasesPerYear = utils.groupingByYearCountPercetange(dfVG_Sales, "Genre")
         self.shimoku.plt.stacked_bar(
-            data=releasesPerYear,
+            data=utils.toPercentage(releasesPerYear),
             x="Year_of_Release",
             x_axis_name="Year of Release",
             order=self.order,
@@ -121,8 +179,11 @@ class Dashboard:
         Returns:
         - None
         """
-        dfVG_Sales = self.dfs["Video_Games_Sales_as_at_22_Dec_2016"]
-        salesPerYearRelease = utils.groupingByYearSales(dfVG_Sales, column)
+        salesPerYearRelease = utils.groupingByYearSales(
+            self.getYearIndex(), column, self.salesColumn
+        )
+        if salesPerYearRelease.empty:
+            return
         self.shimoku.plt.stacked_bar(
             data=salesPerYearRelease,
             x="Year_of_Release",
@@ -140,11 +201,8 @@ class Dashboard:
         )
         self.order += 1
 
-        salesPerYearReleasePercentage = utils.groupingByYearSalesPercetange(
-            dfVG_Sales, column
-        )
         self.shimoku.plt.stacked_bar(
-            data=salesPerYearReleasePercentage,
+            data=utils.toPercentage(salesPerYearRelease),
             x="Year_of_Release",
             x_axis_name="Year of Release",
             order=self.order,
@@ -170,8 +228,11 @@ class Dashboard:
         Returns:
         - None
         """
-        dfVG_Sales = self.dfs["Video_Games_Sales_as_at_22_Dec_2016"]
-        data = utils.getKPIs(dfVG_Sales, column)
+        data = kpis.evaluateKPIs(
+            self.getAggregate(column), kpis.SALES_KPIS, self.locale
+        )
+        if not data:
+            return
         self.shimoku.plt.indicator(
             data=data,
             order=self.order,
@@ -188,12 +249,9 @@ class Dashboard:
         Returns:
         - None
         """
-        dfVG_Sales = self.dfs["Video_Games_Sales_as_at_22_Dec_2016"]
-        genresCount = (
-            dfVG_Sales[dfVG_Sales.Year_of_Release < 2017]
-            .Genre.groupby(dfVG_Sales.Genre)
-            .count()
-        )
+        genresCount = utils.groupingByCount(self.getYearIndex(), "Genre")
+        if genresCount.empty:
+            return
         data = [
             {"Genre": index, "Games Released": row}
             for index, row in genresCount.items()
@@ -210,6 +268,7 @@ class Dashboard:
             title="Games Releases by Genre",
         )
         self.order += 1
+
     def getTop3Data(self, column: str) -> None:
         """
         Gets data for the top 3 items in the specified column and sets up KPIs.
@@ -220,94 +279,12 @@ class Dashboard:
         Returns:
         - None
         """
-        df = self.dfs["Video_Games_Sales_as_at_22_Dec_2016"]
-        dftop3 = utils.getTopN(df, column, 3)
-        top1 = str(dftop3.iloc[0][column])
-        top2 = str(dftop3.iloc[1][column])
-        top3 = str(dftop3.iloc[2][column])
-
-        top1FirstRelease, top1LastRelease = utils.firstLastRelease(df, column, top1)
-        top2FirstRelease, top2LastRelease = utils.firstLastRelease(df, column, top2)
-        top3FirstRelease, top3LastRelease = utils.firstLastRelease(df, column, top3)
-
-        main_kpis = [
-            {
-                "title": f"Top 1 {column}",
-                "description": f"{column} first place in sales",
-                "value": top1,
-                "color": "success",
-                "align": "center",
-            },
-            {
-                "title": f"{top1} First Release",
-                "description": f"{column} first year",
-                "value": top1FirstRelease,
-                "color": "success",
-                "align": "center",
-            },
-            {
-                "title": f"{top1} Last Release",
-                "description": f"{column} last year",
-                "value": top1LastRelease,
-                "color": "success",
-                "align": "center",
-            },
+        aggregate = self.getAggregate(column)
+        self.top3Kpis = [
+            kpis.evaluateKPIs(aggregate, specs, self.locale)
+            for specs in kpis.topNKPIs(3)
         ]
 
-        self.df_app = {"main_kpis": pd.DataFrame(main_kpis)}
-
-        main_kpis2 = [
-            {
-                "title": f"Top 2 {column}",
-                "description": f"{column} second place in sales",
-                "value": top2,
-                "color": "success",
-                "align": "center",
-            },
-            {
-                "title": f"{top2} First Release",
-                "description": f"{column} first year",
-                "value": top2FirstRelease,
-                "color": "success",
-                "align": "center",
-            },
-            {
-                "title": f"{top2} Last Release",
-                "description": f"{column} last year",
-                "value": top2LastRelease,
-                "color": "success",
-                "align": "center",
-            },
-        ]
-
-        self.df_app2 = {"main_kpis2": pd.DataFrame(main_kpis2)}
-
-        main_kpis3 = [
-            {
-                "title": f"Top 3 {column}",
-                "description": f"{column} third place in sales",
-                "value": top3,
-                "color": "success",
-                "align": "center",
-            },
-            {
-                "title": f"{top3} First Release",
-                "description": f"{column} first year",
-                "value": top3FirstRelease,
-                "color": "success",
-                "align": "center",
-            },
-            {
-                "title": f"{top3} Last Release",
-                "description": f"{column} last year",
-                "value": top3LastRelease,
-                "color": "success",
-                "align": "center",
-            },
-        ]
-
-        self.df_app3 = {"main_kpis3": pd.DataFrame(main_kpis3)}
-
     def plotTop3(self) -> None:
         """
         Plots KPIs for the top 3 items in the 'Genre' and 'Platform' columns.
@@ -317,6 +294,10 @@ class Dashboard:
         """
         from paths.top3 import Top3
 
+        # Skip the page when no release of the board is in the year range
+        if not len(self.getYearIndex().rows):
+            return
+
         self.getTop3Data('Genre')
 
         T3G = Top3(self)
@@ -326,11 +307,24 @@ class Dashboard:
 
         self.getTop3Data('Platform')
 
-        T3G.df_app = self.df_app
-        T3G.df_app2 = self.df_app2
-        T3G.df_app3 = self.df_app3
+        T3G.top3Kpis = self.top3Kpis
         subtitle2 = 'The 3 top platforms in videogames with their first and last year release'
         T3G.plot('Top 3 Platforms', subtitle2)
 
+    def plotTrends(self) -> None:
+        """
+        Plots the Trends page with cumulative, rolling, growth and lifecycle charts.
+
+        Returns:
+        - None
+        """
+        from paths.trends import Trends
+
+        # Skip the page when no release of the board is in the year range
+        if not len(self.getYearIndex().rows):
+            return
 
-        
+        trends = Trends(self)
+        yearIndex = self.getYearIndex()
+        subtitle = f"Sales and releases over time, from {yearIndex.firstYear} to {yearIndex.lastYear}"
+        trends.plot("Trends", subtitle)
@@ -0,0 +1,299 @@
+import csv
+import io
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - pandas fallback
+    pa = None
+
+# Column -> type ("string", "category" or "float") of the sales files
+SALES_SCHEMA = {
+    "Name": "string",
+    "Platform": "category",
+    "Year_of_Release": "float",
+    "Genre": "category",
+    "Publisher": "category",
+    "NA_Sales": "float",
+    "EU_Sales": "float",
+    "JP_Sales": "float",
+    "Other_Sales": "float",
+    "Global_Sales": "float",
+    "Critic_Score": "float",
+    "Critic_Count": "float",
+    "User_Score": "float",
+    "User_Count": "float",
+    "Developer": "category",
+    "Rating": "category",
+}
+
+# Rows missing any of these columns are quarantined
+SALES_REQUIRED = ["Platform", "Global_Sales"]
+
+NULL_VALUES = ["", "NA", "N/A", "n/a", "NaN", "nan", "null", "NULL", "None", "#N/A"]
+
+
+@dataclass
+class ValidationReport:
+    """
+    Outcome of reading one file against a schema.
+
+    Attributes:
+        fileName (str): The file read.
+        encoding (str): The detected encoding.
+        engine (str): Parser used, "pyarrow" or "pandas".
+        rows (int): Rows kept.
+        quarantined (list): Raw text or reason of every rejected row.
+        nullRates (dict): Column -> share of null values in the kept rows.
+        coerced (dict): Column -> number of non-null values that failed the type and became
+                        null in the kept rows, so they are part of nullRates.
+        missingColumns (list): Schema columns absent from the file, filled with nulls.
+        errors (list): File level problems (e.g. empty file).
+    """
+
+    fileName: str
+    encoding: str = ""
+    engine: str = ""
+    rows: int = 0
+    quarantined: List[str] = field(default_factory=list)
+    nullRates: Dict[str, float] = field(default_factory=dict)
+    coerced: Dict[str, int] = field(default_factory=dict)
+    missingColumns: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        """
+        Returns a readable summary of the report.
+
+        Returns:
+        - str: The summary.
+        """
+        lines = [
+            f"{self.fileName}: {self.rows} rows, {len(self.quarantined)} quarantined"
+            f" ({self.encoding or '-'}, {self.engine or '-'})"
+        ]
+        lines += [f"  error: {error}" for error in self.errors]
+        if self.missingColumns:
+            lines.append(f"  missing columns: {', '.join(self.missingColumns)}")
+        lines += [
+            f"  {column}: {count} values coerced to null"
+            for column, count in self.coerced.items()
+            if count
+        ]
+        lines += [
+            f"  {column}: {rate:.1%} null"
+            for column, rate in self.nullRates.items()
+            if rate
+        ]
+        return "\n".join(lines)
+
+
+def detectEncoding(raw: bytes) -> str:
+    """
+    Detect the encoding of the raw contents of a file.
+
+    Args:
+        raw (bytes): File contents.
+
+    Returns:
+        str: "utf-8-sig", "utf-8" or "ISO-8859-1" when the contents are not valid UTF-8.
+    """
+    if raw.startswith(b"\xef\xbb\xbf"):
+        return "utf-8-sig"
+    try:
+        raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return "ISO-8859-1"
+    return "utf-8"
+
+
+def _parseArrow(
+    raw: bytes, encoding: str, schema: Dict[str, str], report: ValidationReport
+) -> pd.DataFrame:
+    """
+    Parse with the multi-threaded pyarrow reader, schema columns as strings.
+
+    Args:
+        raw (bytes): File contents.
+        encoding (str): Encoding of the contents.
+        schema (dict): Column -> type, typed later by readTyped.
+        report (ValidationReport): Report receiving the quarantined rows.
+
+    Returns:
+        pd.DataFrame: The parsed rows, columns as strings or None.
+    """
+
+    def quarantine(row) -> str:
+        report.quarantined.append(row.text)
+        return "skip"
+
+    table = pacsv.read_csv(
+        io.BytesIO(raw),
+        read_options=pacsv.ReadOptions(
+            encoding="utf8" if encoding.startswith("utf-8") else encoding,
+            use_threads=True,
+        ),
+        parse_options=pacsv.ParseOptions(invalid_row_handler=quarantine),
+        convert_options=pacsv.ConvertOptions(
+            column_types={column: pa.string() for column in schema},
+            null_values=NULL_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    return table.to_pandas()
+
+
+def _parsePandas(
+    raw: bytes, encoding: str, report: ValidationReport
+) -> pd.DataFrame:
+    """
+    Parse with the csv module when pyarrow is not installed, every column as string.
+
+    Rows with more or fewer fields than the header are quarantined, like the
+    pyarrow reader does; pandas would pad short rows with nulls and keep them.
+
+    Args:
+        raw (bytes): File contents.
+        encoding (str): Encoding of the contents.
+        report (ValidationReport): Report receiving the quarantined rows.
+
+    Returns:
+        pd.DataFrame: The parsed rows, columns as strings or None.
+    """
+    rows = csv.reader(io.StringIO(raw.decode(encoding), newline=""))
+    header = next(rows, [])
+    kept = []
+    for fields in rows:
+        # Blank lines are skipped, not rows
+        if not fields:
+            continue
+        if len(fields) != len(header):
+            line = io.StringIO()
+            csv.writer(line, lineterminator="").writerow(fields)
+            report.quarantined.append(line.getvalue())
+            continue
+        kept.append([None if value in NULL_VALUES else value for value in fields])
+    return pd.DataFrame(kept, columns=header, dtype=object)
+
+
+def readTyped(
+    fileName: str,
+    schema: Dict[str, str] = SALES_SCHEMA,
+    required: List[str] = SALES_REQUIRED,
+) -> Tuple[pd.DataFrame, ValidationReport]:
+    """
+    Read a CSV file into a DataFrame with the types declared in a schema.
+
+    Values that do not fit their type become nulls and are counted in the
+    report, rows with a wrong number of fields or missing required values are
+    quarantined. An empty file, or one without a required column, is reported
+    as an error and gives an empty typed DataFrame.
+
+    Args:
+        fileName (str): File to read.
+        schema (dict): Column -> type ("string", "category" or "float").
+        required (list): Columns that must not be null.
+
+    Returns:
+        Tuple[pd.DataFrame, ValidationReport]: The typed DataFrame and its validation report.
+    """
+    report = ValidationReport(fileName)
+    with open(fileName, "rb") as file:
+        raw = file.read()
+
+    df = pd.DataFrame(columns=list(schema), dtype=object)
+    if not raw.strip():
+        report.errors.append("empty file")
+    else:
+        report.encoding = detectEncoding(raw)
+        if pa is not None:
+            report.engine = "pyarrow"
+            df = _parseArrow(raw, report.encoding, schema, report)
+        else:
+            report.engine = "pandas"
+            df = _parsePandas(raw, report.encoding, report)
+
+    coerced = dict()
+    for column, dtype in schema.items():
+        if column not in df.columns:
+            report.missingColumns.append(column)
+            df[column] = None
+        if dtype == "float":
+            values = pd.to_numeric(df[column], errors="coerce")
+            coerced[column] = values.isna() & df[column].notna()
+            df[column] = values.astype("float64")
+        elif dtype == "category":
+            df[column] = df[column].astype("category")
+        else:
+            df[column] = df[column].astype(object)
+
+    absent = [column for column in required if column in report.missingColumns]
+    if absent:
+        report.errors.append(f"missing required columns: {', '.join(absent)}")
+        df = df.iloc[0:0]
+
+    # Row numbers are left out: pyarrow has already dropped the malformed rows
+    missing = df[required].isna().any(axis=1)
+    if missing.any():
+        report.quarantined += [
+            f"missing {', '.join(row[required][row[required].isna()].index)}: "
+            + ",".join(str(value) for value in row if not pd.isna(value))
+            for _, row in df[missing].iterrows()
+        ]
+        df = df[~missing]
+
+    # Count over the kept rows like nullRates; a required value that became
+    # null is reported by its quarantined row instead
+    report.coerced = {
+        column: int(mask.loc[df.index].sum()) for column, mask in coerced.items()
+    }
+    df = df.reset_index(drop=True)
+    report.rows = len(df)
+    report.nullRates = {
+        column: float(df[column].isna().mean()) if len(df) else 0.0
+        for column in schema
+    }
+    return df, report
+
+
+def loadData(
+    fileNames: List[str],
+    schema: Dict[str, str] = SALES_SCHEMA,
+    required: List[str] = SALES_REQUIRED,
+) -> Tuple[Dict[str, pd.DataFrame], List[ValidationReport]]:
+    """
+    Read several files with readTyped.
+
+    Args:
+        fileNames (list): List of file names.
+        schema (dict): Column -> type shared by the files.
+        required (list): Columns that must not be null.
+
+    Returns:
+        Tuple[dict, list]: Dictionary of dataframes keyed by file name without extension, and the reports.
+    """
+    dictDataframes = dict()
+    reports = []
+    for fileName in fileNames:
+        df, report = readTyped(fileName, schema, required)
+        key = os.path.splitext(os.path.basename(fileName))[0]
+        dictDataframes[key] = df
+        reports.append(report)
+    return dictDataframes, reports
+
+
+def main():
+    # Print the validation report of the files given as arguments
+    _, reports = loadData(sys.argv[1:])
+    for report in reports:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
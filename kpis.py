@@ -0,0 +1,276 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from timeseries import YearIndex
+
+# Thousands and decimal separators per locale
+LOCALES = {
+    "en": (",", "."),
+    "es": (".", ","),
+    "de": (".", ","),
+    "fr": (" ", ","),
+}
+
+ORDINALS = ["first", "second", "third", "fourth", "fifth"]
+
+
+def ordinal(position: int) -> str:
+    """
+    Name a position in a ranking.
+
+    Args:
+        position (int): Position, 1 is the first.
+
+    Returns:
+        str: "first" to "fifth", then "6th", "11th", "21st", "22nd"...
+    """
+    if position <= len(ORDINALS):
+        return ORDINALS[position - 1]
+    suffix = {1: "st", 2: "nd", 3: "rd"}.get(position % 10, "th")
+    if position % 100 in (11, 12, 13):
+        suffix = "th"
+    return f"{position}{suffix}"
+
+
+def formatNumber(value: float, locale: str = "en", decimals: int = 2) -> str:
+    """
+    Format a number with the separators of a locale.
+
+    Args:
+        value (float): Number to format.
+        locale (str): Key of LOCALES.
+        decimals (int): Number of decimals.
+
+    Returns:
+        str: The formatted number.
+    """
+    thousands, decimal = LOCALES.get(locale, LOCALES["en"])
+    text = f"{value:,.{decimals}f}"
+    return text.replace(",", "\0").replace(".", decimal).replace("\0", thousands)
+
+
+def formatText(value: Any, locale: str = "en") -> str:
+    """
+    Format a label as is.
+
+    Args:
+        value (Any): Value to format.
+        locale (str): Unused, kept for the formatter signature.
+
+    Returns:
+        str: The value as a string.
+    """
+    return str(value)
+
+
+def formatInteger(value: float, locale: str = "en") -> str:
+    """
+    Format a count with the thousands separator of a locale.
+
+    Args:
+        value (float): Value to format.
+        locale (str): Key of LOCALES.
+
+    Returns:
+        str: The formatted integer.
+    """
+    return formatNumber(value, locale, decimals=0)
+
+
+def formatYear(value: float, locale: str = "en") -> str:
+    """
+    Format a year without separators or decimals.
+
+    Args:
+        value (float): Year to format, NaN when unknown.
+        locale (str): Unused, kept for the formatter signature.
+
+    Returns:
+        str: The year, or "-" if unknown.
+    """
+    return "-" if pd.isna(value) else str(int(value))
+
+
+@dataclass
+class KPISpec:
+    """
+    Declarative description of one indicator tile.
+
+    Attributes:
+        title (str): Title template. Fields: {column}, {label}, {rank}, {ordinal}.
+        measure (str or Callable): Field of the ColumnAggregate ("label", "sales",
+                                   "firstRelease", "lastRelease", "releases", "groups")
+                                   or a function (aggregate, rank) -> value.
+        formatter (Callable): Function (value, locale) -> str.
+        value (str): Template wrapping the formatted value. Fields: {value}, {column}.
+        description (str): Optional description template, same fields as title.
+        color (str or Callable): Color name or function (value) -> color name.
+        rank (int): Position of the group in the ranking by sales, 0 is the best seller.
+        align (str): Alignment of the tile.
+        variant (str): Optional indicator variant.
+    """
+
+    title: str
+    measure: Union[str, Callable[["ColumnAggregate", int], Any]]
+    formatter: Callable[[Any, str], str] = formatText
+    value: str = "{value}"
+    description: Optional[str] = None
+    color: Union[str, Callable[[Any], str]] = "success"
+    rank: int = 0
+    align: str = "center"
+    variant: Optional[str] = None
+
+
+class ColumnAggregate:
+    """
+    Per-group sales, release counts and first/last release years of a column,
+    read from the grouped yearly sums of a YearIndex and ranked by sales.
+    """
+
+    def __init__(
+        self, yearIndex: YearIndex, column: str, values: str = "Global_Sales"
+    ) -> None:
+        """
+        Initializes the ColumnAggregate object.
+
+        Parameters:
+        - yearIndex (YearIndex): Year index over the video game sales data.
+        - column (str): Column to group by (e.g., 'Genre', 'Platform').
+        - values (str): Sales column to rank by (e.g., 'Global_Sales', 'JP_Sales').
+
+        Returns:
+        - None
+        """
+        labels, releases = yearIndex.sumsBy(column)
+        _, sales = yearIndex.sumsBy(column, values)
+        released = releases > 0
+        last = len(yearIndex.years) - 1
+        # Stable sort keeps the first group on ties, like nlargest
+        ranking = np.argsort(-sales.sum(axis=1), kind="stable")
+
+        self.column = column
+        self.groups = len(labels)
+        self.label = np.array(labels, dtype=object)[ranking]
+        self.sales = sales.sum(axis=1)[ranking]
+        self.firstRelease = yearIndex.years[np.argmax(released, axis=1)][ranking]
+        self.lastRelease = yearIndex.years[last - np.argmax(released[:, ::-1], axis=1)][
+            ranking
+        ]
+        self.releases = releases.sum(axis=1)[ranking]
+
+    def measure(self, measure: Union[str, Callable], rank: int) -> Any:
+        """
+        Evaluates a measure for the group at the given rank.
+
+        Parameters:
+        - measure (str or Callable): Field name or function (aggregate, rank) -> value.
+        - rank (int): Position of the group in the ranking by sales.
+
+        Returns:
+        - Any: The measured value.
+        """
+        if callable(measure):
+            return measure(self, rank)
+        if measure == "groups":
+            return self.groups
+        return getattr(self, measure)[rank]
+
+
+def evaluateKPIs(
+    aggregate: ColumnAggregate, specs: List[KPISpec], locale: str = "en"
+) -> List[Dict[str, str]]:
+    """
+    Evaluate a batch of KPI specs against one aggregate.
+
+    Args:
+        aggregate (ColumnAggregate): The shared aggregate.
+        specs (list): KPISpec objects to evaluate.
+        locale (str): Key of LOCALES used by the formatters.
+
+    Returns:
+        list: Indicator payloads ready for shimoku.plt.indicator.
+    """
+    data = []
+    for spec in specs:
+        if spec.rank >= aggregate.groups:
+            continue
+        fields = {
+            "column": aggregate.column,
+            "label": aggregate.label[spec.rank],
+            "rank": spec.rank + 1,
+            "ordinal": ordinal(spec.rank + 1),
+        }
+        value = aggregate.measure(spec.measure, spec.rank)
+        kpi = {
+            "title": spec.title.format(**fields),
+            "value": spec.value.format(
+                value=spec.formatter(value, locale), column=aggregate.column
+            ),
+            "color": spec.color(value) if callable(spec.color) else spec.color,
+            "align": spec.align,
+        }
+        if spec.description is not None:
+            kpi["description"] = spec.description.format(**fields)
+        if spec.variant is not None:
+            kpi["variant"] = spec.variant
+        data.append(kpi)
+    return data
+
+
+SALES_KPIS = [
+    KPISpec("Most Successful {column}", "label", variant="topColor"),
+    KPISpec(
+        "{label} {column} Total Sales",
+        "sales",
+        formatter=formatNumber,
+        value="{value} Millions USD",
+        variant="topColor",
+    ),
+    KPISpec(
+        "Best out of",
+        "groups",
+        formatter=formatInteger,
+        value="{value} {column}s",
+        variant="topColor",
+    ),
+]
+
+
+def topNKPIs(n: int) -> List[List[KPISpec]]:
+    """
+    Specs for the top N page: name, first and last release of each of the N best sellers.
+
+    Args:
+        n (int): Number of top entries.
+
+    Returns:
+        list: One list of KPISpec objects per rank.
+    """
+    return [
+        [
+            KPISpec(
+                "Top {rank} {column}",
+                "label",
+                description="{column} {ordinal} place in sales",
+                rank=rank,
+            ),
+            KPISpec(
+                "{label} First Release",
+                "firstRelease",
+                formatter=formatYear,
+                description="{column} first year",
+                rank=rank,
+            ),
+            KPISpec(
+                "{label} Last Release",
+                "lastRelease",
+                formatter=formatYear,
+                description="{column} last year",
+                rank=rank,
+            ),
+        ]
+        for rank in range(n)
+    ]
@@ -2,6 +2,8 @@ from os import getenv
 from dotenv import load_dotenv
 import shimoku_api_python as Shimoku
 from dashboard import Dashboard
+from scheduler import ScheduledClient
+from shared import attachSharedDfs, detachShared
 
 
 def main():
@@ -12,6 +14,7 @@ def main():
     access_token = getenv("SHIMOKU_TOKEN")
     universe_id: str = getenv("UNIVERSE_ID")
     workspace_id: str = getenv("WORKSPACE_ID")
+    shared_dataset: str = getenv("SHARED_DATASET")
 
     # Initialize Shimoku client with the provided credentials
 
@@ -23,11 +26,29 @@ def main():
     # Set the workspace for Shimoku client
     s.set_workspace(uuid=workspace_id)
 
-    # Create a Dashboard object using the Shimoku client
-    dboard = Dashboard(s)
-
-    # Set up and display the dashboard
-    dboard.setDashboard()
+    # Rate limit the requests and checkpoint them so an interrupted run resumes
+    s = ScheduledClient(s, checkpoint=".publish_checkpoint", workspace=workspace_id)
+
+    # Create a Dashboard object using the Shimoku client, attaching to the
+    # dataset published by `python shared.py` when SHARED_DATASET is set
+    shm = None
+    if shared_dataset:
+        shm, dfs = attachSharedDfs(shared_dataset)
+        dboard = Dashboard(s, dfs=dfs)
+        del dfs
+    else:
+        dboard = Dashboard(s)
+
+    try:
+        # Set up and display the dashboard
+        dboard.setDashboard()
+        s.flush()
+        s.clearCheckpoint()
+    finally:
+        if shm is not None:
+            # Release the DataFrames over the shared block before closing it
+            del dboard
+            detachShared(shm)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,5 @@
 from typing import Any, Dict, List
 
-from utils import convert_dataframe_to_array
 from dashboard import Dashboard
 
 class Top3(Dashboard):
@@ -15,10 +14,17 @@ class Top3(Dashboard):
         Parameters:
             self_board (Dashboard): An instance of the Dashboard class.
         """
-        super().__init__(self_board.shimoku)
-        self.df_app = self_board.df_app
-        self.df_app2 = self_board.df_app2
-        self.df_app3 = self_board.df_app3
+        super().__init__(
+            self_board.shimoku,
+            self_board.dashboardName,
+            self_board.dfs,
+            self_board.locale,
+            self_board.salesColumn,
+            self_board.firstYear,
+            self_board.lastYear,
+        )
+        self.top3Kpis = self_board.top3Kpis
+        self.aggregates = self_board.aggregates
 
         self.order = 0  # Initialize order of plotting elements
         self.menu_path = "Top 3"  # Set the menu path for this page
@@ -49,44 +55,22 @@ class Top3(Dashboard):
         """
         Plots the Key Performance Indicators (KPIs) for the Top 3 page.
         """
-        self.shimoku.plt.indicator(
-            data=convert_dataframe_to_array(self.df_app["main_kpis"]),
-            order=self.order,
-            rows_size=1,
-            cols_size=12,
-            value="value",
-            header="title",
-            footer="description",
-            color="color",
-            align="align",
-        )
-        self.order += len(self.df_app["main_kpis"]) + 1
-
-        self.shimoku.plt.indicator(
-            data=convert_dataframe_to_array(self.df_app2["main_kpis2"]),
-            order=self.order,
-            rows_size=1,
-            cols_size=12,
-            value="value",
-            header="title",
-            footer="description",
-            color="color",
-            align="align",
-        )
-        self.order += len(self.df_app2["main_kpis2"]) + 1
-
-        self.shimoku.plt.indicator(
-            data=convert_dataframe_to_array(self.df_app3["main_kpis3"]),
-            order=self.order,
-            rows_size=1,
-            cols_size=12,
-            value="value",
-            header="title",
-            footer="description",
-            color="color",
-            align="align",
-        )
-        self.order += len(self.df_app3["main_kpis3"]) + 1
+        for data in self.top3Kpis:
+            # Columns with fewer groups than the top have no data for the last ranks
+            if not data:
+                continue
+            self.shimoku.plt.indicator(
+                data=data,
+                order=self.order,
+                rows_size=1,
+                cols_size=12,
+                value="value",
+                header="title",
+                footer="description",
+                color="color",
+                align="align",
+            )
+            self.order += len(data) + 1
 
     def plotHeader(self, title: str, subtitle: str) -> None:
         """
@@ -0,0 +1,187 @@
+import numpy as np
+
+import timeseries
+from dashboard import Dashboard
+
+
+class Trends(Dashboard):
+    """
+    This path is responsible for rendering the Trends page.
+    """
+
+    def __init__(
+        self, self_board: Dashboard, window: int = 5, platforms: int = 8
+    ) -> None:
+        """
+        Initializes the Trends path with a shimoku client instance.
+
+        Parameters:
+            self_board (Dashboard): An instance of the Dashboard class.
+            window (int): Number of years of the rolling sums.
+            platforms (int): Number of best selling platforms in the lifecycle chart.
+        """
+        super().__init__(
+            self_board.shimoku,
+            self_board.dashboardName,
+            self_board.dfs,
+            self_board.locale,
+            self_board.salesColumn,
+            self_board.firstYear,
+            self_board.lastYear,
+        )
+        self.window = window
+        self.platforms = platforms
+        self.aggregates = self_board.aggregates
+        self.yearIndex = self_board.getYearIndex()
+
+        self.order = 0  # Initialize order of plotting elements
+        self.menu_path = "Trends"  # Set the menu path for this page
+
+        # Delete existing menu path if it exists
+        if self.shimoku.menu_paths.get_menu_path(name=self.menu_path):
+            self.shimoku.menu_paths.delete_menu_path(name=self.menu_path)
+
+        # Create the menu path
+        self.shimoku.set_menu_path(name=self.menu_path)
+
+    def plot(self, title: str, subtitle: str) -> bool:
+        """
+        Plots the Trends page.
+
+        Parameters:
+            title (str): The title of the page.
+            subtitle (str): The subtitle of the page.
+
+        Returns:
+            bool: True if plotting is successful.
+        """
+        self.plotHeader(title, subtitle)
+        self.plotCumulativeSales()
+        self.plotRollingSales("Genre")
+        self.plotGrowth()
+        self.plotLifecycle()
+        return True
+
+    def plotHeader(self, title: str, subtitle: str) -> None:
+        """
+        Plots the header of the Trends page.
+
+        Parameters:
+            title (str): The title of the page.
+            subtitle (str): The subtitle of the page.
+        """
+        self.shimoku.plt.html(
+            order=self.order,
+            html=self.shimoku.html_components.create_h1_title(
+                title=title, subtitle=subtitle
+            ),
+        )
+        self.order += 1
+
+    def plotCumulativeSales(self) -> None:
+        """
+        Plots the cumulative sales and releases by the year of release.
+        """
+        sales = timeseries.cumulativeSum(self.yearIndex.sums(self.salesColumn))
+        releases = timeseries.cumulativeSum(self.yearIndex.sums())
+        data = timeseries.toFrame(
+            self.yearIndex.years,
+            ["Cumulative Sales", "Cumulative Releases"],
+            np.vstack([sales.round(2), releases]),
+        )
+        self.shimoku.plt.line(
+            data=data,
+            x="Year_of_Release",
+            x_axis_name="Year of Release",
+            order=self.order,
+            rows_size=2,
+            cols_size=5,
+            padding="0,0,0,1",
+            title="Cumulative Sales and Releases",
+        )
+        self.order += 1
+
+    def plotRollingSales(self, column: str) -> None:
+        """
+        Plots the rolling sales of every value of a column.
+
+        Parameters:
+            column (str): The column to group by (e.g., 'Genre', 'Platform').
+        """
+        labels, sales = self.yearIndex.sumsBy(column, self.salesColumn)
+        data = timeseries.toFrame(
+            self.yearIndex.years,
+            labels,
+            timeseries.rollingSum(sales, self.window).round(2),
+        )
+        self.shimoku.plt.line(
+            data=data,
+            x="Year_of_Release",
+            x_axis_name="Year of Release",
+            order=self.order,
+            rows_size=2,
+            cols_size=5,
+            padding="0,1,0,0",
+            title=f"Sales of Every {column} over the Last {self.window} Years",
+            option_modifications={"dataZoom": {"show": True}},
+        )
+        self.order += 1
+
+    def plotGrowth(self) -> None:
+        """
+        Plots the year over year growth of sales.
+
+        Years without a defined growth (the first year and years after a year
+        without sales) are left out.
+        """
+        growth = timeseries.yoyGrowth(self.yearIndex.sums(self.salesColumn))
+        defined = ~np.isnan(growth)
+        if not defined.any():
+            return
+        data = timeseries.toFrame(
+            self.yearIndex.years[defined],
+            ["Sales Growth %"],
+            growth[defined].round(2)[None, :],
+        )
+        self.shimoku.plt.bar(
+            data=data,
+            x="Year_of_Release",
+            x_axis_name="Year of Release",
+            y_axis_name="Growth %",
+            order=self.order,
+            rows_size=2,
+            cols_size=10,
+            padding="0,1,0,1",
+            title="Year over Year Sales Growth",
+        )
+        self.order += 1
+
+    def plotLifecycle(self) -> None:
+        """
+        Plots the sales of the best selling platforms by years since their first release.
+        """
+        labels, sales = self.yearIndex.sumsBy("Platform", self.salesColumn)
+        best = np.argsort(-sales.sum(axis=1), kind="stable")[: self.platforms]
+        curves = timeseries.lifecycle(sales[best])
+        # Drop the trailing years no platform reaches
+        active = np.flatnonzero(curves.any(axis=0))
+        if not len(active):
+            return
+        length = int(active.max()) + 1
+        data = timeseries.toFrame(
+            np.arange(length),
+            [labels[i] for i in best],
+            curves[:, :length].round(2),
+            xName="Years since First Release",
+        )
+        self.shimoku.plt.line(
+            data=data,
+            x="Years since First Release",
+            x_axis_name="Years since First Release",
+            order=self.order,
+            rows_size=2,
+            cols_size=10,
+            padding="0,1,0,1",
+            title="Platform Lifecycle Sales",
+        )
+        self.order += 1
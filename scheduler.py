@@ -0,0 +1,427 @@
+import heapq
+import json
+import os
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from shimoku_api_python import Client
+
+# Lower runs first within a page: path creation, headers, indicators, then charts
+PRIORITIES = {"set_menu_path": -1, "html": 0, "indicator": 1}
+DEFAULT_PRIORITY = 2
+
+# Client attributes of these types are values, not namespaces of requests
+PLAIN_TYPES = (str, bytes, int, float, bool, list, tuple, dict, set, type(None))
+
+
+class TokenBucket:
+    """
+    Token bucket limiting the request rate, shareable between clients and threads.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        capacity: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initializes the TokenBucket object.
+
+        Parameters:
+        - rate (float): Tokens added per second, the sustained requests per second.
+        - capacity (int): Maximum tokens, the allowed burst.
+        - clock (Callable): Monotonic clock in seconds.
+        - sleep (Callable): Function waiting the given seconds.
+
+        Returns:
+        - None
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Takes one token, waiting until it is available.
+
+        The token is reserved before waiting, so concurrent callers queue up
+        behind each other instead of racing for the next refill.
+
+        Returns:
+        - None
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate
+        if wait > 0:
+            self.sleep(wait)
+
+
+def isThrottled(error: Exception) -> bool:
+    """
+    Tells whether an API error is a rate limit response.
+
+    Args:
+        error (Exception): The error raised by the client.
+
+    Returns:
+        bool: True for an HTTP 429 status, or a message with both the 429 code
+              and its "Too Many Requests" reason.
+    """
+    response = getattr(error, "response", None)
+    for source in (error, response):
+        for attribute in ("status", "status_code"):
+            if getattr(source, attribute, None) == 429:
+                return True
+    # A bare "429" also matches inside UUIDs, so require the reason phrase too
+    message = str(error).lower()
+    return bool(re.search(r"\b429\b", message)) and "too many requests" in message
+
+
+class _Namespace:
+    """
+    Attribute of the client (e.g. plt, menu_paths, boards) whose calls go through the scheduler.
+    """
+
+    def __init__(self, scheduler: "ScheduledClient", name: str) -> None:
+        self._scheduler = scheduler
+        self._name = name
+
+    def __getattr__(self, method: str) -> Callable:
+        def call(*args, **kwargs):
+            return self._scheduler._call(self._name, method, args, kwargs)
+
+        return call
+
+
+class ScheduledClient:
+    """
+    Wraps a Shimoku client to publish with fewer, rate limited and resumable requests.
+
+    - Menu path lookups are answered from a local cache once known.
+    - Plot calls are queued with the board and menu path they belong to and
+      sent on flush() page by page, by priority within a page, so the board
+      and menu path are set on the remote client once per page.
+    - Every request waits for a token of a TokenBucket and is retried with
+      backoff when the API throttles it.
+    - Completed requests are appended to a checkpoint file, so a publish that
+      was interrupted skips them when it is run again.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        bucket: Optional[TokenBucket] = None,
+        checkpoint: Optional[str] = None,
+        workspace: str = "",
+        maxRetries: int = 5,
+        backoff: float = 1.0,
+        throttled: Callable[[Exception], bool] = isThrottled,
+    ) -> None:
+        """
+        Initializes the ScheduledClient object.
+
+        Parameters:
+        - client (Client): The Shimoku client, already set to its workspace.
+        - bucket (TokenBucket, optional): Rate limiter, share one between clients of the same API.
+        - checkpoint (str, optional): File recording the completed requests.
+        - workspace (str): Workspace of the client, part of the checkpoint keys.
+        - maxRetries (int): Retries of a throttled request before giving up.
+        - backoff (float): Seconds waited after the first throttled attempt, doubled on each retry.
+        - throttled (Callable): Tells whether an error is a rate limit response.
+
+        Returns:
+        - None
+        """
+        self.client = client
+        self.bucket = bucket if bucket is not None else TokenBucket()
+        self.checkpoint = checkpoint
+        self.workspace = workspace
+        self.maxRetries = maxRetries
+        self.backoff = backoff
+        self.throttled = throttled
+
+        self.board: Optional[Tuple[tuple, dict]] = None
+        self.menuPath: Optional[str] = None
+        self.menuPathCall: Optional[Tuple[tuple, dict]] = None
+        self.remoteBoard: Optional[Tuple[tuple, dict]] = None
+        self.remoteMenuPath: Optional[Tuple[tuple, dict]] = None
+        self.menuPaths: Dict[Tuple[str, str], bool] = dict()
+        self.queue: List[tuple] = []
+        self.counters: Dict[str, int] = dict()
+        self.pages: Dict[Tuple[str, Optional[str]], int] = dict()
+        self.sequence = 0
+        self.done: Set[str] = set()
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint) as file:
+                self.done = {line.strip() for line in file if line.strip()}
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Routes client namespaces through the scheduler.
+
+        html_components only builds HTML locally and plain values are returned
+        as is. Methods and the methods of every other namespace (e.g. boards,
+        workspaces) are called after sending the queued requests.
+        """
+        if name.startswith("_") or name == "client":
+            raise AttributeError(name)
+        if name == "html_components":
+            return self.client.html_components
+        attribute = getattr(self.client, name)
+        if isinstance(attribute, PLAIN_TYPES):
+            return attribute
+        if not callable(attribute):
+            return _Namespace(self, name)
+
+        def call(*args, **kwargs):
+            self.flush()
+            return self._send(attribute, args, kwargs)
+
+        return call
+
+    def set_board(self, *args, **kwargs) -> None:
+        """
+        Selects the board the next requests belong to.
+        """
+        self.board = (args, kwargs)
+        self.menuPath = None
+        self.menuPathCall = None
+
+    def set_menu_path(self, *args, **kwargs) -> None:
+        """
+        Selects the menu path the next requests belong to, creating it on flush
+        with the same arguments.
+        """
+        name = kwargs.get("name", args[0] if args else None)
+        # Sub paths and other arguments are separate pages of the same menu path
+        extras = [str(value) for value in args[1:]] + [
+            str(value) for key, value in kwargs.items() if key != "name"
+        ]
+        self.menuPath = "/".join([str(name)] + extras)
+        self.menuPathCall = (args, kwargs)
+        self.menuPaths[(self._boardName(), name)] = True
+        self._enqueue("set_menu_path", None, (), {})
+
+    def _boardName(self) -> str:
+        """
+        Returns the name of the current board for the cache and checkpoint keys.
+        """
+        if self.board is None:
+            return ""
+        args, kwargs = self.board
+        return str(kwargs.get("name", args[0] if args else ""))
+
+    def _call(self, namespace: str, method: str, args: tuple, kwargs: dict) -> Any:
+        """
+        Handles a call to client.<namespace>.<method>.
+        """
+        if namespace == "menu_paths":
+            key = (self._boardName(), kwargs.get("name", args[0] if args else None))
+            if method == "get_menu_path":
+                if key not in self.menuPaths:
+                    self.menuPaths[key] = self._getMenuPath(key[1], args, kwargs)
+                return self.menuPaths[key]
+            if method == "delete_menu_path":
+                # Deleting is a barrier, queued plots may belong to the path
+                self.flush()
+                self.menuPaths[key] = False
+                if self._isDone(self._pathKey("delete_menu_path", key[1])):
+                    return None
+                self._ensureContext(self.board, None)
+                result = self._send(
+                    self.client.menu_paths.delete_menu_path, args, kwargs
+                )
+                # The page is gone remotely, so its requests must be sent again
+                self._forgetPage(key[1])
+                self._markDone(self._pathKey("delete_menu_path", key[1]))
+                self.remoteMenuPath = None
+                return result
+            self.flush()
+            self._ensureContext(self.board, None)
+            return self._send(getattr(self.client.menu_paths, method), args, kwargs)
+
+        if namespace == "plt":
+            self._enqueue(method, self.client.plt, args, kwargs)
+            return None
+
+        # Other namespaces read or change the remote state, so they are a barrier
+        self.flush()
+        return self._send(
+            getattr(getattr(self.client, namespace), method), args, kwargs
+        )
+
+    def _getMenuPath(self, name: Any, args: tuple, kwargs: dict) -> bool:
+        """
+        Tells whether a menu path exists, answering like the interrupted run did.
+
+        A path found on a rerun may be the one the interrupted run created, so
+        the first answer is checkpointed and replayed: the rerun then resumes
+        the page instead of deleting it and publishing it again.
+        """
+        for found in (True, False):
+            if self._isDone(self._pathKey("get_menu_path", [name, found])):
+                return found
+        self._ensureContext(self.board, None)
+        found = bool(self._send(self.client.menu_paths.get_menu_path, args, kwargs))
+        self._markDone(self._pathKey("get_menu_path", [name, found]))
+        return found
+
+    def _pathKey(self, method: str, identifier: Any) -> str:
+        """
+        Returns the checkpoint key of a request on a menu path of the current board.
+
+        Unlike _key it does not depend on the current menu path, and deleting a
+        page does not forget it.
+        """
+        return json.dumps(
+            [self.workspace, self._boardName(), None, method, identifier], default=str
+        )
+
+    def _key(self, method: str, identifier: Any) -> str:
+        """
+        Returns the checkpoint key of a request.
+        """
+        return json.dumps(
+            [self.workspace, self._boardName(), self.menuPath, method, identifier],
+            default=str,
+        )
+
+    def _enqueue(self, method: str, target: Any, args: tuple, kwargs: dict) -> None:
+        """
+        Queues a request with the board and menu path it belongs to.
+        """
+        context = json.dumps([self._boardName(), self.menuPath, method], default=str)
+        self.counters[context] = self.counters.get(context, 0) + 1
+        identifier = kwargs.get("order", self.counters[context])
+        priority = PRIORITIES.get(method, DEFAULT_PRIORITY)
+        page = self.pages.setdefault(
+            (self._boardName(), self.menuPath), len(self.pages)
+        )
+        heapq.heappush(
+            self.queue,
+            (
+                page,
+                priority,
+                self.sequence,
+                self._key(method, identifier),
+                self.board,
+                self.menuPathCall,
+                method,
+                target,
+                args,
+                kwargs,
+            ),
+        )
+        self.sequence += 1
+
+    def flush(self) -> None:
+        """
+        Sends the queued requests page by page and by priority within a page,
+        skipping those already checkpointed.
+
+        Returns:
+        - None
+        """
+        while self.queue:
+            _, _, _, key, board, menuPathCall, method, target, args, kwargs = (
+                heapq.heappop(self.queue)
+            )
+            if self._isDone(key):
+                continue
+            self._ensureContext(board, menuPathCall)
+            if target is not None:
+                self._send(getattr(target, method), args, kwargs)
+            self._markDone(key)
+
+    def clearCheckpoint(self) -> None:
+        """
+        Forgets the completed requests once a publish has finished.
+
+        Returns:
+        - None
+        """
+        self.done = set()
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+    def _ensureContext(
+        self,
+        board: Optional[Tuple[tuple, dict]],
+        menuPathCall: Optional[Tuple[tuple, dict]],
+    ) -> None:
+        """
+        Sets the board and menu path on the remote client when they differ.
+        """
+        if board is not None and board != self.remoteBoard:
+            self._send(self.client.set_board, *board)
+            self.remoteBoard = board
+            self.remoteMenuPath = None
+        if menuPathCall is not None and menuPathCall != self.remoteMenuPath:
+            self._send(self.client.set_menu_path, *menuPathCall)
+            self.remoteMenuPath = menuPathCall
+
+    def _send(self, function: Callable, args: tuple, kwargs: dict) -> Any:
+        """
+        Calls the client once a token is available, retrying throttled requests.
+        """
+        for attempt in range(self.maxRetries + 1):
+            self.bucket.acquire()
+            try:
+                return function(*args, **kwargs)
+            except Exception as error:
+                if attempt == self.maxRetries or not self.throttled(error):
+                    raise
+                self.bucket.sleep(self.backoff * 2**attempt)
+
+    def _forgetPage(self, menuPath: str) -> None:
+        """
+        Removes the checkpointed requests of a menu path, and of its sub paths,
+        of the current board.
+        """
+
+        def inPath(key: str) -> bool:
+            workspace, board, page = json.loads(key)[:3]
+            return (
+                workspace == self.workspace
+                and board == self._boardName()
+                and page is not None
+                and (page == menuPath or page.startswith(menuPath + "/"))
+            )
+
+        forgotten = {key for key in self.done if inPath(key)}
+        if not forgotten:
+            return
+        self.done -= forgotten
+        if self.checkpoint:
+            with open(self.checkpoint, "w") as file:
+                file.writelines(key + "\n" for key in self.done)
+
+    def _isDone(self, key: str) -> bool:
+        """
+        Tells whether a request was completed by a previous run.
+        """
+        return key in self.done
+
+    def _markDone(self, key: str) -> None:
+        """
+        Records a completed request in the checkpoint.
+        """
+        self.done.add(key)
+        if self.checkpoint:
+            with open(self.checkpoint, "a") as file:
+                file.write(key + "\n")
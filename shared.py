@@ -0,0 +1,209 @@
+import gc
+import json
+import logging
+import sys
+import time
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import utils
+
+CATEGORY_COLUMNS = ["Platform", "Genre", "Publisher"]
+NUMERIC_COLUMNS = [
+    "Year_of_Release",
+    "NA_Sales",
+    "EU_Sales",
+    "JP_Sales",
+    "Other_Sales",
+    "Global_Sales",
+]
+
+logger = logging.getLogger(__name__)
+
+HEADER_SIZE = 8  # Bytes holding the length of the JSON layout
+ALIGNMENT = 64
+
+# Block name -> arrays attached over it, checked before the block is closed
+_attached: Dict[str, List[weakref.ref]] = dict()
+
+
+def _align(offset: int) -> int:
+    """
+    Round an offset up to the next array boundary.
+
+    Args:
+        offset (int): Offset in bytes.
+
+    Returns:
+        int: Aligned offset.
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def publishSharedDataset(
+    df: pd.DataFrame, name: str
+) -> shared_memory.SharedMemory:
+    """
+    Write the normalized columns of a DataFrame into a named shared memory block.
+
+    Category columns are stored as integer codes with their categories in the
+    layout, numeric columns as float64 arrays. The caller owns the block and
+    must close() and unlink() it once no worker needs it.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame containing video game sales data.
+        name (str): Name of the shared memory block.
+
+    Returns:
+        shared_memory.SharedMemory: The created block.
+    """
+    arrays = dict()
+    categories = dict()
+    for column in CATEGORY_COLUMNS:
+        categorical = pd.Categorical(df[column])
+        arrays[column] = categorical.codes
+        categories[column] = categorical.categories.tolist()
+    for column in NUMERIC_COLUMNS:
+        arrays[column] = df[column].to_numpy(dtype=np.float64)
+
+    # The layout size depends on the offsets it stores, so reserve room for
+    # the widest offsets before laying out the arrays
+    columns = dict()
+    layout = {"rows": len(df), "columns": columns, "categories": categories}
+    for column, array in arrays.items():
+        columns[column] = {"dtype": array.dtype.str, "offset": 10**15}
+    offset = _align(HEADER_SIZE + len(json.dumps(layout).encode()))
+    for column, array in arrays.items():
+        columns[column] = {"dtype": array.dtype.str, "offset": offset}
+        offset = _align(offset + array.nbytes)
+    layoutBytes = json.dumps(layout).encode()
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=offset)
+    shm.buf[:HEADER_SIZE] = len(layoutBytes).to_bytes(HEADER_SIZE, "little")
+    shm.buf[HEADER_SIZE : HEADER_SIZE + len(layoutBytes)] = layoutBytes
+    for column, array in arrays.items():
+        target = np.ndarray(
+            array.shape,
+            dtype=array.dtype,
+            buffer=shm.buf,
+            offset=columns[column]["offset"],
+        )
+        target[:] = array
+    return shm
+
+
+def attachSharedDataset(name: str) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+    """
+    Attach to a block written by publishSharedDataset without copying it.
+
+    The returned DataFrame is backed by read-only arrays over the shared
+    block, so keep the returned SharedMemory alive while the DataFrame is used.
+
+    Args:
+        name (str): Name of the shared memory block.
+
+    Returns:
+        Tuple[shared_memory.SharedMemory, pd.DataFrame]: The attached block and the DataFrame over it.
+    """
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+        # Only the publishing process may unlink the block on exit
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+    layoutSize = int.from_bytes(shm.buf[:HEADER_SIZE], "little")
+    layout = json.loads(bytes(shm.buf[HEADER_SIZE : HEADER_SIZE + layoutSize]))
+
+    data = dict()
+    for column, spec in layout["columns"].items():
+        array = np.ndarray(
+            (layout["rows"],),
+            dtype=np.dtype(spec["dtype"]),
+            buffer=shm.buf,
+            offset=spec["offset"],
+        )
+        array.setflags(write=False)
+        _attached.setdefault(shm.name, []).append(weakref.ref(array))
+        if column in layout["categories"]:
+            array = pd.Categorical.from_codes(
+                array, categories=layout["categories"][column]
+            )
+        data[column] = array
+
+    return shm, pd.DataFrame(data, copy=False)
+
+
+def attachSharedDfs(
+    name: str, key: str = "Video_Games_Sales_as_at_22_Dec_2016"
+) -> Tuple[shared_memory.SharedMemory, Dict[str, pd.DataFrame]]:
+    """
+    Attach to a shared dataset and wrap it like utils.getData output.
+
+    Args:
+        name (str): Name of the shared memory block.
+        key (str): Key to store the DataFrame under.
+
+    Returns:
+        Tuple[shared_memory.SharedMemory, dict]: The attached block and the dictionary of dataframes.
+    """
+    shm, df = attachSharedDataset(name)
+    return shm, {key: df}
+
+
+def detachShared(shm: shared_memory.SharedMemory) -> None:
+    """
+    Close a block attached with attachSharedDataset.
+
+    Drop every DataFrame over the block before calling this: its arrays keep
+    pointers into the block, and numpy does not stop the block from being
+    closed under them, so reading them afterwards would crash the process.
+    When they are still referenced (e.g. by the traceback of an error being
+    raised) a warning is logged and the block is left open until exit.
+
+    Args:
+        shm (shared_memory.SharedMemory): The attached block.
+
+    Returns:
+        None
+    """
+    gc.collect()
+    alive = sum(ref() is not None for ref in _attached.get(shm.name, []))
+    if alive:
+        logger.warning(
+            "Shared dataset '%s' is still referenced by %d arrays and was not closed",
+            shm.name,
+            alive,
+        )
+        return
+    _attached.pop(shm.name, None)
+    try:
+        shm.close()
+    except BufferError:
+        logger.warning(
+            "Shared dataset '%s' is still referenced and was not closed", shm.name
+        )
+
+
+def main():
+    # Load the sales table once and keep it published until interrupted
+    name = sys.argv[1] if len(sys.argv) > 1 else "video_games_sales"
+    dfs = utils.getData(["./data/Video_Games_Sales_as_at_22_Dec_2016.csv"])
+    shm = publishSharedDataset(dfs["Video_Games_Sales_as_at_22_Dec_2016"], name)
+    print(f"Shared dataset '{name}' published ({shm.size} bytes), Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import pytest
+
+from scheduler import ScheduledClient, TokenBucket, isThrottled
+
+
+class Throttled(Exception):
+    status_code = 429
+
+
+class Crash(Exception):
+    pass
+
+
+class FakeApi:
+    """
+    Remote state of a fake Shimoku workspace: menu paths and their tiles.
+    """
+
+    def __init__(self, throttleEvery=0, crashAt=0):
+        self.paths = dict()
+        self.board = None
+        self.menuPath = None
+        self.calls = 0
+        self.throttles = 0
+        self.throttleEvery = throttleEvery
+        self.crashAt = crashAt
+
+    def request(self):
+        self.calls += 1
+        if self.throttleEvery and self.calls % self.throttleEvery == 0:
+            self.throttles += 1
+            raise Throttled("Too Many Requests")
+        if self.calls == self.crashAt:
+            raise Crash("connection lost")
+
+
+class FakeClient:
+    """
+    Client over a FakeApi with the parts of the Shimoku client the app uses.
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self.plt = FakePlt(api)
+        self.menu_paths = FakeMenuPaths(api)
+        self.boards = FakeBoards(api)
+        self.menuPathCalls = []
+        self.workspace = "w"
+
+    def set_board(self, name):
+        self.api.request()
+        self.api.board = name
+
+    def set_menu_path(self, name, **kwargs):
+        self.api.request()
+        self.menuPathCalls.append((name, kwargs))
+        self.api.menuPath = name
+        self.api.paths.setdefault(name, set())
+
+
+class FakePlt:
+    def __init__(self, api):
+        self.api = api
+
+    def __getattr__(self, method):
+        def plot(order, **kwargs):
+            self.api.request()
+            self.api.paths[self.api.menuPath].add((method, order))
+
+        return plot
+
+
+class FakeMenuPaths:
+    def __init__(self, api):
+        self.api = api
+
+    def get_menu_path(self, name):
+        self.api.request()
+        return name in self.api.paths
+
+    def delete_menu_path(self, name):
+        self.api.request()
+        del self.api.paths[name]
+
+
+class FakeBoards:
+    def __init__(self, api):
+        self.api = api
+
+    def get_board(self, name):
+        self.api.request()
+        return {"name": name, "paths": sorted(self.api.paths)}
+
+
+def publish(client):
+    """
+    Publishes a Top 3 like page: delete the menu path if it exists, then plot.
+    """
+    client.set_board(name="Board")
+    if client.menu_paths.get_menu_path(name="Top 3"):
+        client.menu_paths.delete_menu_path(name="Top 3")
+    client.set_menu_path(name="Top 3")
+    client.plt.html(order=0, html="<h1>Top 3</h1>")
+    for order in range(1, 8):
+        client.plt.indicator(order=order, data=[])
+    client.flush()
+
+
+EXPECTED = {("html", 0)} | {("indicator", order) for order in range(1, 8)}
+
+
+def scheduled(api, checkpoint=None):
+    clock = [0.0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    bucket = TokenBucket(rate=5, capacity=10, clock=lambda: clock[0], sleep=sleep)
+    return ScheduledClient(FakeClient(api), bucket, checkpoint, workspace="w")
+
+
+def test_throttled_requests_are_retried():
+    api = FakeApi(throttleEvery=3)
+    publish(scheduled(api))
+    assert api.throttles > 0
+    assert api.paths == {"Top 3": EXPECTED}
+
+
+@pytest.mark.parametrize("existed", [False, True])
+def test_resume_after_crash_publishes_every_tile(tmp_path, existed):
+    checkpoint = str(tmp_path / "checkpoint")
+    api = FakeApi(crashAt=7)
+    if existed:
+        api.paths["Top 3"] = {("html", 0)}
+    with pytest.raises(Crash):
+        publish(scheduled(api, checkpoint))
+    missing = EXPECTED - api.paths["Top 3"]
+    assert missing
+
+    calls = api.calls
+    publish(scheduled(api, checkpoint))
+    assert api.paths == {"Top 3": EXPECTED}
+    # Only set_board, set_menu_path and the missing tiles, the page is not deleted
+    assert api.calls - calls == 2 + len(missing)
+
+
+def test_menu_path_arguments_are_replayed():
+    client = scheduled(FakeApi())
+    client.set_board(name="Board")
+    client.set_menu_path(name="Top 3", sub_path="Genres")
+    client.plt.html(order=0, html="")
+    client.flush()
+    assert client.client.menuPathCalls == [("Top 3", {"sub_path": "Genres"})]
+
+
+def test_other_namespaces_are_scheduled():
+    api = FakeApi(throttleEvery=2)
+    client = scheduled(api)
+    client.set_board(name="Board")
+    client.set_menu_path(name="Top 3")
+    client.plt.html(order=0, html="")
+    # The queued page is sent first and the throttled request is retried
+    assert client.boards.get_board(name="Board") == {"name": "Board", "paths": ["Top 3"]}
+    assert api.throttles == 3
+    assert client.workspace == "w"
+
+
+def test_is_throttled():
+    assert isThrottled(Throttled())
+    assert isThrottled(Exception("HTTP 429: Too Many Requests"))
+    assert not isThrottled(Exception("Board 8f2a4291-77aa not found"))
+    assert not isThrottled(Exception("429 menu paths"))
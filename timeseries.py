@@ -0,0 +1,184 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Last complete year of the dataset, later releases are announcements
+LAST_YEAR = 2016
+
+
+class YearIndex:
+    """
+    Dense year axis over a DataFrame: one array slot per year of the range.
+
+    The row -> slot mapping is computed once, after that every per-year sum is
+    a single np.bincount with no reindexing. Grouped sums are cached, so the
+    charts and KPIs of a board share them.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        firstYear: Optional[int] = None,
+        lastYear: int = LAST_YEAR,
+    ) -> None:
+        """
+        Initializes the YearIndex object.
+
+        Parameters:
+        - df (pd.DataFrame): Input DataFrame containing video game sales data.
+        - firstYear (int, optional): First year of the range, defaults to the first release.
+        - lastYear (int): Last year of the range (inclusive).
+
+        Returns:
+        - None
+        """
+        years = df["Year_of_Release"].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(years) & (years <= lastYear)
+        if firstYear is None:
+            firstYear = int(years[valid].min()) if valid.any() else lastYear
+        valid &= years >= firstYear
+
+        self.df = df
+        self.firstYear = firstYear
+        self.lastYear = lastYear
+        self.years = np.arange(firstYear, lastYear + 1)
+        self.rows = np.flatnonzero(valid)
+        self.slots = (years[self.rows] - firstYear).astype(np.intp)
+        self.grouped: Dict[Tuple[str, Optional[str]], Tuple[List[str], np.ndarray]] = dict()
+
+    def sums(self, values: Optional[str] = None) -> np.ndarray:
+        """
+        Sums a column per year, or counts the releases when no column is given.
+
+        Parameters:
+        - values (str, optional): Column to sum (e.g., 'Global_Sales').
+
+        Returns:
+        - np.ndarray: One value per year of the range.
+        """
+        weights = None
+        if values is not None:
+            weights = self.df[values].to_numpy(dtype=np.float64)[self.rows]
+        return np.bincount(self.slots, weights=weights, minlength=len(self.years))
+
+    def sumsBy(
+        self, column: str, values: Optional[str] = None
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Sums a column per group and year, or counts the releases when no column is given.
+
+        Parameters:
+        - column (str): Column to group by (e.g., 'Genre', 'Platform').
+        - values (str, optional): Column to sum (e.g., 'Global_Sales').
+
+        Returns:
+        - Tuple[list, np.ndarray]: Group labels and a (groups x years) matrix, shared
+          between callers so do not modify it.
+        """
+        if (column, values) in self.grouped:
+            return self.grouped[(column, values)]
+        codes, labels = pd.factorize(self.df[column].to_numpy()[self.rows], sort=True)
+        keep = codes >= 0
+        nYears = len(self.years)
+        weights = None
+        if values is not None:
+            weights = self.df[values].to_numpy(dtype=np.float64)[self.rows][keep]
+        flat = np.bincount(
+            codes[keep] * nYears + self.slots[keep],
+            weights=weights,
+            minlength=len(labels) * nYears,
+        )
+        self.grouped[(column, values)] = (list(labels), flat.reshape(len(labels), nYears))
+        return self.grouped[(column, values)]
+
+
+def cumulativeSum(series: np.ndarray) -> np.ndarray:
+    """
+    Running total along the year axis.
+
+    Args:
+        series (np.ndarray): Per-year values, years on the last axis.
+
+    Returns:
+        np.ndarray: Cumulative values.
+    """
+    return np.cumsum(series, axis=-1)
+
+
+def rollingSum(series: np.ndarray, window: int) -> np.ndarray:
+    """
+    Sum over the last `window` years, shorter at the start of the range.
+
+    Args:
+        series (np.ndarray): Per-year values, years on the last axis.
+        window (int): Number of years in the window, at least 1.
+
+    Returns:
+        np.ndarray: Rolling sums.
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+    padded = np.zeros(series.shape[:-1] + (series.shape[-1] + 1,))
+    padded[..., 1:] = np.cumsum(series, axis=-1)
+    lagged = np.zeros_like(padded[..., 1:])
+    if window < padded.shape[-1]:
+        lagged[..., window:] = padded[..., 1:-window]
+    return padded[..., 1:] - lagged
+
+
+def yoyGrowth(series: np.ndarray) -> np.ndarray:
+    """
+    Year over year growth in percentage, NaN where the previous year is 0.
+
+    Args:
+        series (np.ndarray): Per-year values, years on the last axis.
+
+    Returns:
+        np.ndarray: Growth per year, NaN for the first year.
+    """
+    growth = np.full(series.shape, np.nan)
+    previous = series[..., :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth[..., 1:] = np.where(
+            previous != 0, (series[..., 1:] - previous) / previous * 100, np.nan
+        )
+    return growth
+
+
+def lifecycle(series: np.ndarray) -> np.ndarray:
+    """
+    Align each group on its first year with activity (years since first release).
+
+    Args:
+        series (np.ndarray): (groups x years) matrix.
+
+    Returns:
+        np.ndarray: (groups x years) matrix where column i is i years after the first release.
+    """
+    nYears = series.shape[-1]
+    first = np.argmax(series > 0, axis=-1)
+    shifted = first[:, None] + np.arange(nYears)
+    inRange = shifted < nYears
+    aligned = np.take_along_axis(series, np.minimum(shifted, nYears - 1), axis=-1)
+    return np.where(inRange, aligned, 0)
+
+
+def toFrame(
+    x: np.ndarray, labels: List[str], matrix: np.ndarray, xName: str = "Year_of_Release"
+) -> pd.DataFrame:
+    """
+    Lay out a (groups x years) matrix like the pivot tables in utils.
+
+    Args:
+        x (np.ndarray): Values of the x axis.
+        labels (list): Group labels, one column each.
+        matrix (np.ndarray): (groups x years) matrix.
+        xName (str): Name of the x column.
+
+    Returns:
+        pd.DataFrame: One row per x value and one column per group.
+    """
+    df = pd.DataFrame(matrix.T, columns=labels)
+    df.insert(0, xName, x)
+    return df